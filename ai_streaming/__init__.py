@@ -0,0 +1,20 @@
+"""
+AI streaming provider package.
+
+Exposes the request/response models and provider configuration used by the
+FastAPI application in main.py.
+"""
+
+from ai_streaming.models import (
+    Message,
+    ProviderConfig,
+    StreamingChunk,
+    StreamingRequest,
+)
+
+__all__ = [
+    "Message",
+    "ProviderConfig",
+    "StreamingChunk",
+    "StreamingRequest",
+]
@@ -0,0 +1,51 @@
+"""
+Factory for constructing AI providers from configuration.
+"""
+
+from typing import Dict, List, Type
+
+from ai_streaming.models import ProviderConfig
+from ai_streaming.providers.base import BaseAIProvider
+from ai_streaming.providers.bedrock import BedrockProvider
+
+
+class ProviderFactory:
+    """Creates provider instances by name."""
+
+    _providers: Dict[str, Type[BaseAIProvider]] = {
+        "bedrock": BedrockProvider,
+    }
+
+    @classmethod
+    def create_provider(cls, config: ProviderConfig) -> BaseAIProvider:
+        """
+        Create a provider instance from the given configuration.
+
+        Args:
+            config: Provider configuration
+
+        Returns:
+            Configured provider instance
+
+        Raises:
+            ValueError: If the provider name is not registered
+        """
+        provider_cls = cls._providers.get(config.provider_name)
+
+        if provider_cls is None:
+            raise ValueError(
+                f"Unknown provider: {config.provider_name}. "
+                f"Available providers: {', '.join(cls._providers)}"
+            )
+
+        return provider_cls(config)
+
+    @classmethod
+    def list_providers(cls) -> List[str]:
+        """
+        List all registered provider names.
+
+        Returns:
+            List of provider names
+        """
+        return list(cls._providers.keys())
@@ -0,0 +1,43 @@
+"""
+Pydantic models shared between the API layer and the providers.
+"""
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class Message(BaseModel):
+    """A single chat message."""
+
+    role: str
+    content: str
+
+
+class StreamingRequest(BaseModel):
+    """Request body for a streaming chat completion."""
+
+    messages: List[Message]
+    max_tokens: int = 1024
+    temperature: float = 0.7
+
+
+class StreamingChunk(BaseModel):
+    """A single chunk of streamed completion content."""
+
+    content: str = ""
+    is_final: bool = False
+
+
+class ProviderConfig(BaseModel):
+    """Configuration for an AI provider."""
+
+    provider_name: str
+    model_id: str
+    region: str = "us-east-1"
+    api_key: Optional[str] = None
+    latency_optimized: bool = True
+    max_pool_connections: int = 50
+    # Optional mapping of complexity tiers ("simple"/"standard"/"complex")
+    # to model IDs; tiers without an entry fall back to model_id.
+    routing_table: Dict[str, str] = {}
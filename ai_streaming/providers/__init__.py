@@ -0,0 +1,12 @@
+"""
+Provider implementations.
+"""
+
+from ai_streaming.providers.base import BaseAIProvider
+from ai_streaming.providers.bedrock import BedrockProvider, RegionClientPool
+
+__all__ = [
+    "BaseAIProvider",
+    "BedrockProvider",
+    "RegionClientPool",
+]
@@ -0,0 +1,67 @@
+"""
+Abstract base class for AI providers.
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+
+from ai_streaming.models import ProviderConfig, StreamingChunk, StreamingRequest
+
+
+class BaseAIProvider(ABC):
+    """Common interface implemented by all AI providers."""
+
+    def __init__(self, config: ProviderConfig):
+        self.config = config
+        # Count of SSE streams currently iterating this provider's
+        # client, maintained by the API layer. Lets a replaced provider
+        # be closed only after its in-flight streams finish.
+        self.active_streams = 0
+
+    @abstractmethod
+    def stream_completion(
+        self,
+        request: StreamingRequest,
+        model_id_override: Optional[str] = None
+    ) -> AsyncIterator[StreamingChunk]:
+        """
+        Stream completion chunks for the given request.
+
+        Args:
+            request: Streaming request with messages and parameters
+            model_id_override: Model ID to use instead of the configured one
+
+        Yields:
+            StreamingChunk objects as content arrives
+        """
+        ...
+
+    async def close(self):
+        """Release any connections or clients held by the provider."""
+        pass
+
+    async def drain_and_close(self, poll_interval: float = 1.0, max_wait: float = 600.0):
+        """
+        Close once all in-flight streams have finished.
+
+        Streams can run for minutes, so a replaced provider must not tear
+        down its client under live iterators. Polls active_streams until
+        it reaches zero (or max_wait elapses as a hang safeguard), then
+        closes.
+        """
+        deadline = time.monotonic() + max_wait
+        while self.active_streams > 0 and time.monotonic() < deadline:
+            await asyncio.sleep(poll_interval)
+        await self.close()
+
+    @abstractmethod
+    async def validate_connection(self) -> bool:
+        """
+        Check that the provider is reachable with the current configuration.
+
+        Returns:
+            True if the provider connection is usable
+        """
+        ...
@@ -0,0 +1,205 @@
+"""
+AWS Bedrock provider using invoke_model_with_response_stream.
+"""
+
+import asyncio
+import os
+from typing import AsyncIterator, Optional
+
+import aioboto3
+import orjson
+import botocore.session
+from botocore.config import Config
+
+from ai_streaming.models import ProviderConfig, StreamingChunk, StreamingRequest
+from ai_streaming.providers.base import BaseAIProvider
+
+# One session per process: credential resolution is expensive and the
+# session itself is cheap to share across clients.
+_session = aioboto3.Session()
+
+# Creating a throwaway sync client at import loads botocore's service model
+# JSON and compiles the endpoint ruleset, so that cost (hundreds of ms on a
+# cold interpreter) is paid at startup instead of on the first request.
+botocore.session.get_session().create_client(
+    'bedrock-runtime',
+    region_name=os.getenv('AWS_REGION', 'us-east-1')
+)
+
+
+class BedrockProvider(BaseAIProvider):
+    """Streams completions from AWS Bedrock."""
+
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        self._boto_config = Config(
+            region_name=config.region,
+            retries={'max_attempts': 2, 'mode': 'standard'},
+            max_pool_connections=config.max_pool_connections,
+            connect_timeout=5,
+            read_timeout=60,
+            tcp_keepalive=True
+        )
+        self._client = None
+        self._client_cm = None
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self):
+        """
+        Return the shared long-lived async client, creating it on first use.
+
+        All streams multiplex over this client's keep-alive connection
+        pool, so concurrent requests reuse established TLS sessions
+        instead of paying a handshake per invoke.
+        """
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client_cm = _session.client(
+                        'bedrock-runtime', config=self._boto_config
+                    )
+                    self._client = await self._client_cm.__aenter__()
+        return self._client
+
+    async def close(self):
+        """Close the shared client and its connection pool."""
+        if self._client_cm is not None:
+            await self._client_cm.__aexit__(None, None, None)
+            self._client = None
+            self._client_cm = None
+
+    async def stream_completion(
+        self,
+        request: StreamingRequest,
+        model_id_override: Optional[str] = None
+    ) -> AsyncIterator[StreamingChunk]:
+        """
+        Stream completion chunks from Bedrock.
+
+        Uses an async client so socket reads never block the event loop,
+        letting concurrent SSE requests stream independently.
+
+        Args:
+            request: Streaming request with messages and parameters
+            model_id_override: Model ID to use instead of the configured one
+
+        Yields:
+            StreamingChunk objects as content arrives
+        """
+        body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "messages": [
+                {"role": m.role, "content": m.content} for m in request.messages
+            ]
+        }
+
+        # orjson.dumps returns bytes, which botocore accepts directly,
+        # skipping both the pure-Python encoder and a utf-8 encode.
+        invoke_kwargs = {
+            "modelId": model_id_override or self.config.model_id,
+            "body": orjson.dumps(body)
+        }
+
+        # Latency-optimized inference roughly halves time-to-first-chunk on
+        # supported models (Claude Haiku, Llama) at no quality cost.
+        if self.config.latency_optimized:
+            invoke_kwargs["performanceConfigLatency"] = "optimized"
+
+        client = await self._get_client()
+        response = await client.invoke_model_with_response_stream(
+            **invoke_kwargs
+        )
+
+        async for event in response['body']:
+            chunk = event.get('chunk')
+            if not chunk:
+                continue
+
+            chunk_data = orjson.loads(chunk['bytes'])
+            chunk_type = chunk_data.get('type')
+
+            if chunk_type == 'content_block_delta':
+                text = chunk_data.get('delta', {}).get('text', '')
+                if text:
+                    yield StreamingChunk(content=text)
+
+            elif chunk_type == 'message_stop':
+                yield StreamingChunk(is_final=True)
+                break
+
+    async def validate_connection(self) -> bool:
+        """
+        Check that AWS credentials are resolvable for this session.
+
+        Returns:
+            True if credentials are available
+        """
+        try:
+            credentials = await _session.get_credentials()
+            return credentials is not None
+        except Exception:
+            return False
+
+
+class RegionClientPool:
+    """
+    Long-lived bedrock-runtime clients keyed by region.
+
+    Warming a region at startup opens its client and completes the TLS
+    handshake, so the first real cross-region request (failover or
+    routing) doesn't pay connection setup at p99.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._client_cms = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, region: str):
+        """Return the client for a region, opening it on first use."""
+        if region not in self._clients:
+            async with self._lock:
+                if region not in self._clients:
+                    cm = _session.client(
+                        'bedrock-runtime',
+                        config=Config(
+                            region_name=region,
+                            retries={'max_attempts': 2, 'mode': 'standard'},
+                            max_pool_connections=10,
+                            connect_timeout=5,
+                            read_timeout=60,
+                            tcp_keepalive=True
+                        )
+                    )
+                    self._clients[region] = await cm.__aenter__()
+                    self._client_cms[region] = cm
+        return self._clients[region]
+
+    async def warm(self, region: str, model_id: str):
+        """Open the region's client and prime TLS with a one-token invoke."""
+        client = await self.get(region)
+        body = orjson.dumps({
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 1,
+            "messages": [{"role": "user", "content": "Hi"}]
+        })
+        try:
+            response = await client.invoke_model_with_response_stream(
+                modelId=model_id,
+                body=body
+            )
+            async for _event in response['body']:
+                break
+        except Exception:
+            # Even a failed invoke completes the TLS handshake, which is
+            # all the warmup needs.
+            pass
+
+    async def close(self):
+        """Close all pooled clients."""
+        for cm in self._client_cms.values():
+            await cm.__aexit__(None, None, None)
+        self._clients.clear()
+        self._client_cms.clear()
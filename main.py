@@ -2,21 +2,110 @@
 FastAPI application for AI streaming service.
 """
 
+import asyncio
 import os
+import time
+
+import orjson
 from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException, Depends
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from ai_streaming import StreamingRequest, ProviderConfig
+from ai_streaming import Message, StreamingRequest, ProviderConfig
 from ai_streaming.factory import ProviderFactory
 from ai_streaming.providers.base import BaseAIProvider
+from ai_streaming.providers.bedrock import RegionClientPool
+
+
+def _create_default_provider() -> BaseAIProvider:
+    """Build the default provider (Bedrock) from environment variables."""
+    config = ProviderConfig(
+        provider_name=os.getenv("AI_PROVIDER", "bedrock"),
+        model_id=os.getenv("AI_MODEL_ID", "us.anthropic.claude-haiku-4-5-20250910-v1:0"),
+        region=os.getenv("AWS_REGION", "us-east-1"),
+        api_key=os.getenv("AI_API_KEY")
+    )
+    return ProviderFactory.create_provider(config)
+
+
+# Registered provider names never change at runtime, so snapshot them
+# once instead of walking the registry on every /v1/providers request.
+_PROVIDERS_CACHE = tuple(ProviderFactory.list_providers())
+
+# SSE framing bytes, hoisted out of the per-token hot path.
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
+
+# Global provider instance, created at import so botocore's model loading
+# and endpoint resolution don't count toward first-request latency.
+_provider: Optional[BaseAIProvider] = _create_default_provider()
+
+def _create_warmup_provider(config: ProviderConfig) -> BaseAIProvider:
+    """Build the isolated small-pool provider used by warmup."""
+    return ProviderFactory.create_provider(
+        config.model_copy(update={"max_pool_connections": 2})
+    )
 
 
-# Global provider instance
-_provider: Optional[BaseAIProvider] = None
+# Warmup gets its own provider with a tiny connection pool so its I/O can
+# never starve or contend with the pool serving live requests.
+_warmup_provider: Optional[BaseAIProvider] = _create_warmup_provider(_provider.config)
+
+# How often the background task re-warms the model container, and how long
+# a single warmup invoke may take before it is abandoned.
+WARMUP_INTERVAL_SECONDS = int(os.getenv("WARMUP_INTERVAL_SECONDS", "120"))
+WARMUP_TIMEOUT_SECONDS = 30
+
+# Regions whose clients get a pre-warmed TLS connection at startup, for
+# cross-region failover/routing without a first-request handshake.
+KNOWN_REGIONS = tuple(
+    region.strip()
+    for region in os.getenv("WARM_REGIONS", "us-east-1,us-west-2,eu-west-1").split(",")
+    if region.strip()
+)
+
+# Monotonic timestamp of the last real completion request. Warmup only
+# fires when traffic has been idle — live requests already keep the
+# container warm, so warming under load is pure cost.
+_last_request_ts: float = 0.0
+
+
+async def _warmup_invoke(provider: BaseAIProvider):
+    """Send a one-token request through the provider and drain the first chunk."""
+    # Built in-process, so skip Pydantic validation via model_construct.
+    request = StreamingRequest.model_construct(
+        messages=[Message.model_construct(role="user", content="Hi")],
+        max_tokens=1
+    )
+    async for _chunk in provider.stream_completion(request):
+        break
+
+
+async def warmup_model():
+    """Re-warm the model container and connection pool while traffic is idle."""
+    while True:
+        await asyncio.sleep(WARMUP_INTERVAL_SECONDS)
+
+        # Skip when a real request arrived recently: the container is
+        # already warm and a warmup invoke would only contend with it.
+        if time.monotonic() - _last_request_ts < WARMUP_INTERVAL_SECONDS:
+            continue
+
+        try:
+            # time.monotonic is a direct C call; no event-loop lookup needed.
+            warmup_start = time.monotonic()
+            await asyncio.wait_for(
+                _warmup_invoke(_warmup_provider), timeout=WARMUP_TIMEOUT_SECONDS
+            )
+            elapsed_ms = (time.monotonic() - warmup_start) * 1000
+            print(f"🔥 Warmup completed in {elapsed_ms:.0f}ms")
+        except Exception as e:
+            print(f"⚠️ Warmup request failed: {e}")
 
 
 @asynccontextmanager
@@ -24,25 +113,51 @@ async def lifespan(app: FastAPI):
     """Initialize and cleanup resources."""
     global _provider
 
-    # Initialize default provider (Bedrock)
-    provider_name = os.getenv("AI_PROVIDER", "bedrock")
-    model_id = os.getenv("AI_MODEL_ID", "us.anthropic.claude-haiku-4-5-20250910-v1:0")
-    region = os.getenv("AWS_REGION", "us-east-1")
-    api_key = os.getenv("AI_API_KEY")
+    if _provider is None:
+        _provider = _create_default_provider()
+
+    config = _provider.config
+    print(f"✅ Provider initialized: {config.provider_name} ({config.model_id})")
 
-    config = ProviderConfig(
-        provider_name=provider_name,
-        model_id=model_id,
-        region=region,
-        api_key=api_key
+    # Warm TLS, the connection pool, and the model container before the
+    # first user request hits them cold. This goes through _provider so
+    # the shared client serving real traffic is the one that gets primed;
+    # the periodic task keeps using its own isolated provider.
+    try:
+        await _warmup_invoke(_provider)
+        print("🔥 Startup warmup completed")
+    except Exception as e:
+        print(f"⚠️ Startup warmup failed: {e}")
+
+    # Pre-warm one client per known region so the first cross-region
+    # request doesn't pay a TLS handshake.
+    app.state.clients = RegionClientPool()
+    results = await asyncio.gather(
+        *(app.state.clients.warm(region, config.model_id) for region in KNOWN_REGIONS),
+        return_exceptions=True
     )
+    warmed = []
+    for region, result in zip(KNOWN_REGIONS, results):
+        if isinstance(result, Exception):
+            print(f"⚠️ Region client warmup failed for {region}: {result}")
+        else:
+            warmed.append(region)
+    if warmed:
+        print(f"🌐 Region clients warmed: {', '.join(warmed)}")
 
-    _provider = ProviderFactory.create_provider(config)
-    print(f"✅ Provider initialized: {provider_name} ({model_id})")
+    warmup_task = asyncio.create_task(warmup_model())
 
     yield
 
     # Cleanup if needed
+    warmup_task.cancel()
+    try:
+        await warmup_task
+    except asyncio.CancelledError:
+        pass
+    await app.state.clients.close()
+    await _warmup_provider.close()
+    await _provider.close()
     _provider = None
     print("🛑 Application shutdown complete")
 
@@ -51,7 +166,8 @@ app = FastAPI(
     title="AI Streaming API",
     description="FastAPI service for streaming AI completions from multiple providers",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -64,6 +180,29 @@ app.add_middleware(
 )
 
 
+def _select_model(request: StreamingRequest, config: ProviderConfig) -> Optional[str]:
+    """
+    Pick a model override for the request's complexity tier.
+
+    Uses a cheap word-count heuristic (thresholds at 50/200) so simple
+    prompts can be routed to a lighter, faster model via the provider's
+    routing_table. Returns None when no routing applies.
+    """
+    if not config.routing_table:
+        return None
+
+    word_count = sum(len(m.content.split()) for m in request.messages)
+
+    if word_count < 50:
+        tier = "simple"
+    elif word_count < 200:
+        tier = "standard"
+    else:
+        tier = "complex"
+
+    return config.routing_table.get(tier)
+
+
 def get_provider() -> BaseAIProvider:
     """Dependency to get the current provider."""
     if _provider is None:
@@ -96,39 +235,48 @@ async def health_check(provider: BaseAIProvider = Depends(get_provider)):
     }
 
 
-@app.post("/v1/chat/completions")
-async def create_completion(
+def _stream_response(
     request: StreamingRequest,
-    provider: BaseAIProvider = Depends(get_provider)
-):
+    provider: BaseAIProvider
+) -> StreamingResponse:
     """
-    Create a streaming chat completion.
-
-    Args:
-        request: Streaming request with messages and parameters
+    Build the SSE response for an already-validated streaming request.
 
-    Returns:
-        Streaming response with AI-generated content
+    In-process callers can pass model_construct'd requests here directly,
+    skipping FastAPI's Pydantic re-validation; external traffic goes
+    through the validated route below.
     """
+    model_id_override = _select_model(request, provider.config)
+
     async def generate():
         """Generator function for streaming response."""
+        # Track in-flight streams so a replaced provider is only closed
+        # once its last stream drains (see configure_provider).
+        provider.active_streams += 1
         try:
-            async for chunk in provider.stream_completion(request):
-                # Send as server-sent events
+            async for chunk in provider.stream_completion(
+                request, model_id_override=model_id_override
+            ):
+                # Send as server-sent events. Build a plain dict and yield
+                # bytes so the hot per-token loop skips Pydantic
+                # serialization and Starlette's utf-8 encode.
                 if chunk.content:
-                    yield f"data: {chunk.model_dump_json()}\n\n"
+                    payload = {"content": chunk.content, "is_final": chunk.is_final}
+                    yield _SSE_PREFIX + orjson.dumps(payload) + _SSE_SUFFIX
 
                 if chunk.is_final:
-                    yield f"data: {chunk.model_dump_json()}\n\n"
-                    yield "data: [DONE]\n\n"
-                    break
+                    yield _SSE_DONE
+                    return
 
         except Exception as e:
             error_chunk = {
                 "error": str(e),
                 "is_final": True
             }
-            yield f"data: {error_chunk}\n\n"
+            yield _SSE_PREFIX + orjson.dumps(error_chunk) + _SSE_SUFFIX
+
+        finally:
+            provider.active_streams -= 1
 
     return StreamingResponse(
         generate(),
@@ -140,43 +288,110 @@ async def create_completion(
     )
 
 
-@app.post("/v1/provider/configure")
-async def configure_provider(config: ProviderConfig):
+@app.post("/v1/chat/completions")
+async def create_completion(
+    request: StreamingRequest,
+    provider: BaseAIProvider = Depends(get_provider)
+):
     """
-    Reconfigure the AI provider at runtime.
+    Create a streaming chat completion.
 
     Args:
-        config: New provider configuration
+        request: Streaming request with messages and parameters
 
     Returns:
-        Success message
+        Streaming response with AI-generated content
     """
-    global _provider
+    global _last_request_ts
+    _last_request_ts = time.monotonic()
 
-    try:
-        _provider = ProviderFactory.create_provider(config)
+    return _stream_response(request, provider)
 
-        # Validate the new provider
-        is_valid = await _provider.validate_connection()
 
-        if not is_valid:
-            raise HTTPException(
-                status_code=400,
-                detail="Failed to validate new provider configuration"
-            )
+@app.post("/v1/warmup/trigger")
+async def trigger_warmup():
+    """
+    Fire a warmup invoke immediately.
+
+    Uses the internal warmup path directly — no HTTP self-call and no
+    request re-validation.
+
+    Returns:
+        Success message with the warmup duration
+    """
+    try:
+        # Manual triggers warm the provider serving real traffic.
+        warmup_start = time.monotonic()
+        await asyncio.wait_for(
+            _warmup_invoke(get_provider()), timeout=WARMUP_TIMEOUT_SECONDS
+        )
+        elapsed_ms = (time.monotonic() - warmup_start) * 1000
 
         return {
-            "message": "Provider configured successfully",
-            "provider": config.provider_name,
-            "model": config.model_id
+            "message": "Warmup completed",
+            "elapsed_ms": round(elapsed_ms)
         }
 
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Warmup failed: {str(e)}")
+
+
+@app.post("/v1/provider/configure")
+async def configure_provider(config: ProviderConfig):
+    """
+    Reconfigure the AI provider at runtime.
+
+    Args:
+        config: New provider configuration
+
+    Returns:
+        Success message
+    """
+    global _provider, _warmup_provider
+
+    try:
+        new_provider = ProviderFactory.create_provider(config)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    # Validate the new provider before swapping it in, so a failed
+    # configure leaves the current provider untouched.
+    try:
+        is_valid = await new_provider.validate_connection()
     except Exception as e:
+        await new_provider.close()
         raise HTTPException(status_code=500, detail=f"Configuration error: {str(e)}")
 
+    if not is_valid:
+        await new_provider.close()
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to validate new provider configuration"
+        )
+
+    old_provider = _provider
+    _provider = new_provider
+
+    # Keep warmup pointed at what the service actually serves: rebuild
+    # its isolated provider from the new config so the periodic task
+    # warms the new model/region instead of the old ones forever.
+    old_warmup = _warmup_provider
+    _warmup_provider = _create_warmup_provider(config)
+
+    # Providers hold a long-lived client; release the replaced ones, but
+    # only after any in-flight streams still iterating them have drained —
+    # closing under live iterators would kill active responses.
+    if old_provider is not None:
+        asyncio.create_task(old_provider.drain_and_close())
+    if old_warmup is not None:
+        asyncio.create_task(old_warmup.drain_and_close())
+
+    return {
+        "message": "Provider configured successfully",
+        "provider": config.provider_name,
+        "model": config.model_id
+    }
+
 
 @app.get("/v1/providers")
 async def list_providers():
@@ -187,7 +402,7 @@ async def list_providers():
         List of provider names
     """
     return {
-        "providers": ProviderFactory.list_providers()
+        "providers": _PROVIDERS_CACHE
     }
 
 